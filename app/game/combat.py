@@ -39,13 +39,14 @@ class CombatHandler:
         
         # Get all players adjacent to the target
         adjacent_player_ids = game_state.pitch.get_adjacent_players(target_pos)
+        players = game_state.players
         
         for player_id in adjacent_player_ids:
             # Skip the blocker themselves
             if player_id == blocker.id:
                 continue
             
-            player = game_state.get_player(player_id)
+            player = players[player_id]
             
             # Only count standing friendly players
             if player.team_id == blocker.team_id and player.is_standing:
@@ -329,10 +330,11 @@ class CombatHandler:
         # Count assists (teammates adjacent) and opponents adjacent
         friendly_assists = 0
         opponent_adjacent = 0
+        players = game_state.players
 
         for player_id, pos in game_state.pitch.player_positions.items():
             if pos.is_adjacent(fouler_pos):
-                player = game_state.get_player(player_id)
+                player = players[player_id]
                 if player.team_id == fouler.team_id and player.id != fouler.id:
                     if player.is_standing:
                         friendly_assists += 1
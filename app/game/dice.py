@@ -38,12 +38,13 @@ class DiceRoller:
         
         success = final_result >= target
         
+        # Copy so later changes to the caller's dict don't rewrite the record
         return DiceRoll(
             type=roll_type,
             result=result,
             target=target,
             success=success,
-            modifiers=modifiers
+            modifiers=dict(modifiers)
         )
     
     def roll_agility(self, target: int, modifiers: Optional[dict[str, int]] = None) -> DiceRoll:
@@ -116,6 +116,7 @@ class EventLogger:
             event: The event to log
         """
         self.game_state.events.append(event)
+        self.game_state.bump_version()
 
     # Movement events
 
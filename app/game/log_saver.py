@@ -12,7 +12,7 @@ from typing import Optional
 from datetime import datetime
 
 from app.models.game_state import GameState
-from app.models.events import GameEvent, GameStatistics
+from app.models.events import GameEvent, GameStatistics, dump_events
 from app.game.log_formatter import MarkdownLogFormatter
 from app.game.statistics import StatisticsAggregator
 
@@ -119,7 +119,7 @@ class LogSaver:
                 "score": game_state.team2.score,
             },
             "phase": game_state.phase.value,
-            "events": [event.model_dump(mode="json") for event in game_state.events],
+            "events": dump_events(game_state.events),
         }
 
         file_path.write_text(json.dumps(events_data, indent=2), encoding="utf-8")
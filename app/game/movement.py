@@ -2,7 +2,7 @@
 from typing import Optional
 from app.models.game_state import GameState
 from app.models.player import Player
-from app.models.pitch import Position
+from app.models.pitch import ADJACENT_OFFSETS, Position
 from app.models.enums import SkillType, PlayerState
 from app.models.actions import DiceRoll
 from app.game.dice import DiceRoller
@@ -20,13 +20,37 @@ class MovementHandler:
             game_state.team2.id if team_id == game_state.team1.id else game_state.team1.id
         )
         
+        players = game_state.players
         count = 0
         for player_id in game_state.pitch.get_adjacent_players(pos):
-            player = game_state.get_player(player_id)
+            player = players[player_id]
             if player.team_id == opposing_team_id and player.is_standing:
                 count += 1
         
         return count
+
+    def get_tackle_zone_map(self, game_state: GameState, team_id: str) -> dict[tuple[int, int], int]:
+        """Count enemy tackle zones for every square at once.
+
+        Returns (x, y) -> zone count; squares missing from the map have none.
+        Cheaper than calling get_tackle_zones per square when assessing a
+        whole path.
+        """
+        opposing_team_id = (
+            game_state.team2.id if team_id == game_state.team1.id else game_state.team1.id
+        )
+
+        players = game_state.players
+        zones: dict[tuple[int, int], int] = {}
+        for player_id, pos in game_state.pitch.player_positions.items():
+            player = players[player_id]
+            if player.team_id != opposing_team_id or not player.is_standing:
+                continue
+            for dx, dy in ADJACENT_OFFSETS:
+                key = (pos.x + dx, pos.y + dy)
+                zones[key] = zones.get(key, 0) + 1
+
+        return zones
     
     def requires_dodge(
         self,
@@ -45,13 +69,18 @@ class MovementHandler:
         game_state: GameState,
         player: Player,
         from_pos: Position,
-        to_pos: Position
+        to_pos: Position,
+        enemy_zones_at_dest: Optional[int] = None
     ) -> dict[str, int]:
-        """Calculate modifiers for a dodge roll"""
+        """Calculate modifiers for a dodge roll
+
+        ``enemy_zones_at_dest`` may be passed when the caller already knows it.
+        """
         modifiers = {}
         
         # Enemy tackle zones at destination
-        enemy_zones_at_dest = self.get_tackle_zones(game_state, player.team_id, to_pos)
+        if enemy_zones_at_dest is None:
+            enemy_zones_at_dest = self.get_tackle_zones(game_state, player.team_id, to_pos)
         if enemy_zones_at_dest > 0:
             modifiers["tackle_zones"] = -enemy_zones_at_dest
         
@@ -66,11 +95,14 @@ class MovementHandler:
         game_state: GameState,
         player: Player,
         from_pos: Position,
-        to_pos: Position
+        to_pos: Position,
+        enemy_zones_at_dest: Optional[int] = None
     ) -> DiceRoll:
         """Attempt a dodge roll"""
         agility_target = player.get_agility_target()
-        modifiers = self.calculate_dodge_modifiers(game_state, player, from_pos, to_pos)
+        modifiers = self.calculate_dodge_modifiers(
+            game_state, player, from_pos, to_pos, enemy_zones_at_dest
+        )
         
         return self.dice.roll_dodge(agility_target, modifiers)
     
@@ -122,6 +154,8 @@ class MovementHandler:
         ma_remaining = player.movement_remaining
         max_steps = ma_remaining + 2  # up to 2 rush squares
 
+        # Search on plain (x, y) tuples; Positions are only needed for output
+        occupied = game_state.pitch.occupancy_grid()
         visited: dict[tuple[int, int], int] = {(start.x, start.y): 0}
         queue: deque[tuple[int, int, int]] = deque([(start.x, start.y, 0)])
         reachable: list[dict] = []
@@ -146,8 +180,7 @@ class MovementHandler:
                     if key in visited and visited[key] <= new_steps:
                         continue
 
-                    next_pos = Position(x=nx, y=ny)
-                    if game_state.pitch.is_occupied(next_pos):
+                    if key in occupied:
                         continue
 
                     visited[key] = new_steps
@@ -194,6 +227,10 @@ class MovementHandler:
             if rush_needed > 2:
                 return False, dice_rolls, "Can only rush up to 2 squares"
         
+        # Opponents stay put while this player moves, so one zone map serves
+        # every square of the path instead of two neighbour scans per step
+        zones = self.get_tackle_zone_map(game_state, player.team_id)
+        
         # Move along path
         for i, target_pos in enumerate(path):
             # Check if move is valid
@@ -205,9 +242,15 @@ class MovementHandler:
             if not current_pos.is_adjacent(target_pos):
                 return False, dice_rolls, "Can only move to adjacent squares"
             
-            # Check if dodge is needed
-            if self.requires_dodge(game_state, player, current_pos, target_pos):
-                dodge_roll = self.attempt_dodge(game_state, player, current_pos, target_pos)
+            # Check if dodge is needed (only when leaving an enemy tackle zone)
+            if zones.get((current_pos.x, current_pos.y), 0) > 0:
+                dodge_roll = self.attempt_dodge(
+                    game_state,
+                    player,
+                    current_pos,
+                    target_pos,
+                    zones.get((target_pos.x, target_pos.y), 0),
+                )
                 dice_rolls.append(dodge_roll)
                 
                 if not dodge_roll.success:
@@ -256,6 +299,7 @@ class MovementHandler:
             return None
 
         max_steps = player.movement_remaining + 2
+        occupied = game_state.pitch.occupancy_grid()
 
         # prev maps (x, y) → predecessor (x, y) or None for start
         prev: dict[tuple[int, int], Optional[tuple[int, int]]] = {
@@ -288,8 +332,7 @@ class MovementHandler:
                         continue
                     if (nx, ny) in prev:
                         continue
-                    npos = Position(x=nx, y=ny)
-                    if game_state.pitch.is_occupied(npos):
+                    if (nx, ny) in occupied:
                         continue
                     prev[(nx, ny)] = (x, y)
                     queue.append((nx, ny, steps + 1))
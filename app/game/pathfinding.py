@@ -39,6 +39,12 @@ class PathSuggestion(BaseModel):
     error_message: Optional[str] = None
 
 
+class PathRequest(BaseModel):
+    """A single player/target pair in a batch path query"""
+    player_id: str
+    target_position: Position
+
+
 class PathFinder:
     """Calculates paths and assesses movement risk"""
     
@@ -83,24 +89,41 @@ class PathFinder:
         player: Player,
         from_pos: Position,
         to_pos: Position,
-        is_rush_square: bool
+        is_rush_square: bool,
+        tackle_zones: Optional[dict[tuple[int, int], int]] = None,
+        occupants: Optional[dict[tuple[int, int], str]] = None
     ) -> SquareRisk:
-        """Assess the risk of moving to a specific square"""
+        """Assess the risk of moving to a specific square
+
+        ``tackle_zones`` (from MovementHandler.get_tackle_zone_map) and
+        ``occupants`` (from Pitch.occupancy_grid) let callers assessing a
+        whole path compute the board once instead of rescanning it per square.
+        """
         
         # Check if out of bounds
         out_of_bounds = not (0 <= to_pos.x < 26 and 0 <= to_pos.y < 15)
         
         # Check if occupied
-        is_occupied = game_state.pitch.is_occupied(to_pos) if not out_of_bounds else False
+        if out_of_bounds:
+            is_occupied = False
+        elif occupants is not None:
+            is_occupied = (to_pos.x, to_pos.y) in occupants
+        else:
+            is_occupied = game_state.pitch.is_occupied(to_pos)
         
         # Count tackle zones
-        tackle_zones_leaving = self.movement.get_tackle_zones(
-            game_state, player.team_id, from_pos
-        ) if not out_of_bounds else 0
-        
-        tackle_zones_entering = self.movement.get_tackle_zones(
-            game_state, player.team_id, to_pos
-        ) if not out_of_bounds else 0
+        if out_of_bounds:
+            tackle_zones_leaving = tackle_zones_entering = 0
+        elif tackle_zones is not None:
+            tackle_zones_leaving = tackle_zones.get((from_pos.x, from_pos.y), 0)
+            tackle_zones_entering = tackle_zones.get((to_pos.x, to_pos.y), 0)
+        else:
+            tackle_zones_leaving = self.movement.get_tackle_zones(
+                game_state, player.team_id, from_pos
+            )
+            tackle_zones_entering = self.movement.get_tackle_zones(
+                game_state, player.team_id, to_pos
+            )
         
         # Determine if dodge is required
         requires_dodge = tackle_zones_leaving > 0
@@ -113,7 +136,7 @@ class PathFinder:
         if requires_dodge:
             dodge_target = player.get_agility_target()
             dodge_modifiers = self.movement.calculate_dodge_modifiers(
-                game_state, player, from_pos, to_pos
+                game_state, player, from_pos, to_pos, tackle_zones_entering
             )
             
             # Calculate success probability
@@ -149,11 +172,16 @@ class PathFinder:
         self,
         game_state: GameState,
         player_id: str,
-        target_pos: Position
+        target_pos: Position,
+        tackle_zones: Optional[dict[tuple[int, int], int]] = None,
+        occupants: Optional[dict[tuple[int, int], str]] = None,
     ) -> PathSuggestion:
         """
         Suggest a path for a player to reach a target position.
         Returns path with complete risk assessment.
+
+        tackle_zones (for the player's team) and occupants may be passed
+        in when the caller already has them for the current board.
         """
         player = game_state.get_player(player_id)
         current_pos = game_state.pitch.player_positions.get(player_id)
@@ -213,7 +241,11 @@ class PathFinder:
                 error_message=f"Path requires {rush_squares} rush squares (max 2)"
             )
         
-        # Assess risk for each square
+        # Assess risk for each square against one snapshot of the board
+        if tackle_zones is None:
+            tackle_zones = self.movement.get_tackle_zone_map(game_state, player.team_id)
+        if occupants is None:
+            occupants = game_state.pitch.occupancy_grid()
         risks = []
         from_pos = current_pos
         total_risk_score = 0.0
@@ -222,7 +254,9 @@ class PathFinder:
         
         for i, to_pos in enumerate(path):
             is_rush = i >= normal_movement
-            risk = self.assess_square_risk(game_state, player, from_pos, to_pos, is_rush)
+            risk = self.assess_square_risk(
+                game_state, player, from_pos, to_pos, is_rush, tackle_zones, occupants
+            )
             risks.append(risk)
             
             # Check validity
@@ -261,3 +295,33 @@ class PathFinder:
             is_valid=is_valid,
             error_message=error_message
         )
+
+    def suggest_paths(
+        self,
+        game_state: GameState,
+        requests: list[PathRequest]
+    ) -> list[PathSuggestion]:
+        """
+        Suggest paths for several players against the same board.
+        The occupancy grid and each team's tackle-zone map are built once
+        and shared by every request.
+        """
+        occupants = game_state.pitch.occupancy_grid()
+        zones_by_team: dict[str, dict[tuple[int, int], int]] = {}
+        suggestions = []
+
+        for request in requests:
+            team_id = game_state.get_player(request.player_id).team_id
+            if team_id not in zones_by_team:
+                zones_by_team[team_id] = self.movement.get_tackle_zone_map(
+                    game_state, team_id
+                )
+            suggestions.append(self.suggest_path(
+                game_state,
+                request.player_id,
+                request.target_position,
+                zones_by_team[team_id],
+                occupants,
+            ))
+
+        return suggestions
@@ -1,15 +1,21 @@
 """FastAPI application for Ankh-Morpork Scramble"""
 from __future__ import annotations
 
+import itertools
+import json
 import logging
 import os
+import threading
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+from pydantic import TypeAdapter
+
 from fastapi import Depends, FastAPI, HTTPException, Header, Query
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import PlainTextResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 import asyncio
 from app.logging_utils import configure_root_logger
@@ -17,7 +23,7 @@ from app.web import router as ui_router
 from app.web.versus_get_started import router as versus_router
 from app.api.middleware import rate_limiter, sanitize_id
 
-from app.models.game_state import GameState
+from app.models.game_state import GameMessage, GameMessagesResponse, GameState
 from app.models.team import TeamType
 from app.models.actions import (
     ActionRequest,
@@ -28,12 +34,16 @@ from app.models.actions import (
     PurchaseResult,
     AvailablePositionsResponse
 )
-from app.models.pitch import Position
+from app.models.pitch import ADJACENT_OFFSETS, Position
+from app.models.player import Player
+from app.game.dice import DiceRoller
+from app.game.movement import MovementHandler
+from app.game.pathfinding import PathFinder, PathRequest
 from app.setup.default_game import DEFAULT_GAME_ID, bootstrap_default_game
 from app.setup.interactive_game import INTERACTIVE_GAME_ID, bootstrap_interactive_game
 from app.state.game_manager import GameManager
 from app.game.statistics import StatisticsAggregator
-from app.models.events import GameStatistics
+from app.models.events import GameEventListAdapter, GameStatistics
 from app.models.leaderboard import LeaderboardResponse
 from app.models.agent import AgentIdentity, AgentContext, JoinRequest, JoinResponse, LobbyStatusResponse
 from app.state.agent_registry import AgentRegistry, init_db, _get_conn
@@ -45,6 +55,116 @@ game_manager = GameManager()
 agent_registry = AgentRegistry()
 lobby_manager = LobbyManager(game_manager)
 
+# Shared helpers for read-only queries (reachable squares, path suggestions).
+# These never roll dice, so a single instance can serve every request.
+dice_roller = DiceRoller()
+movement_handler = MovementHandler(dice_roller)
+pathfinder = PathFinder(movement_handler)
+
+# Serialised valid-action views keyed by (game_id, state_version). Agents poll
+# this several times per decision while the state is unchanged; any mutation
+# bumps the version.
+_VALID_ACTIONS_CACHE_SIZE = 64
+_valid_actions_cache: OrderedDict[tuple[str, int], str] = OrderedDict()
+
+# Per-version baselines that /delta diffs against when a client polls with
+# since_version, keyed by (game_id, state_version).
+_STATE_SNAPSHOT_CACHE_SIZE = 64
+_state_snapshots: OrderedDict[tuple[str, int], dict] = OrderedDict()
+
+# Append-only logs that /delta sends as a tail, with their list encoders
+_DELTA_LOG_ADAPTERS = {
+    "events": GameEventListAdapter,
+    "event_log": TypeAdapter(list[str]),
+    "messages": TypeAdapter(list[GameMessage]),
+}
+_PLAYER_ADAPTER = TypeAdapter(Player)
+
+# Sync routes run in the threadpool, so guard both caches' bookkeeping.
+_CACHE_LOCK = threading.Lock()
+
+# Upper bound on entries per /suggest-paths call; each one runs a full search.
+_MAX_PATH_REQUESTS = 32
+
+
+def _json_response(content: str) -> Response:
+    """Wrap JSON already produced by pydantic-core's encoder.
+
+    Hot endpoints dump their models with ``model_dump_json`` in a single pass
+    instead of letting FastAPI build a dict and re-encode it with ``json``.
+    """
+    return Response(content=content, media_type="application/json")
+
+
+def _state_snapshot(game_state: GameState) -> dict:
+    """Baseline for /delta at the current version.
+
+    Holds the small top-level fields and each player as JSON-ready values,
+    plus the length and newest entry of each append-only log, so later
+    deltas can send only the entries appended since.
+    """
+    key = (game_state.game_id, game_state.state_version)
+    with _CACHE_LOCK:
+        snapshot = _state_snapshots.get(key)
+    if snapshot is None:
+        snapshot = {
+            "fields": game_state.model_dump(
+                mode="json", exclude={"players", *_DELTA_LOG_ADAPTERS}
+            ),
+            "players": {
+                player_id: _PLAYER_ADAPTER.dump_python(player, mode="json")
+                for player_id, player in game_state.players.items()
+            },
+            "logs": {
+                name: (len(log), log[-1] if log else None)
+                for name in _DELTA_LOG_ADAPTERS
+                for log in (getattr(game_state, name),)
+            },
+        }
+        with _CACHE_LOCK:
+            _state_snapshots[key] = snapshot
+            while len(_state_snapshots) > _STATE_SNAPSHOT_CACHE_SIZE:
+                _state_snapshots.popitem(last=False)
+    return snapshot
+
+
+def _appended_entries(log, previous: tuple[int, object]) -> Optional[list]:
+    """Entries added to a log since a snapshot, or None if it was rewritten.
+
+    A bounded log that is full drops its oldest entry on every append, so
+    its length no longer says where the new tail starts; treat it as
+    rewritten and let the caller send the whole log.
+    """
+    previous_length, previous_last = previous
+    length = len(log)
+    if length < previous_length:
+        return None
+    if previous_length and log[previous_length - 1] is not previous_last:
+        return None
+    if length == getattr(log, "maxlen", None) and length != previous_length:
+        return None
+    # Walk back from the newest entry so only the tail is touched
+    tail = list(itertools.islice(reversed(log), length - previous_length))
+    tail.reverse()
+    return tail
+
+
+def _state_response(game_state: GameState) -> Response:
+    """Serve a game state from its per-version JSON cache.
+
+    Returning the model itself would make FastAPI dump it, re-validate the
+    dump against ``response_model`` and encode it again.
+    """
+    return _json_response(game_state.cached_json())
+
+
+def _require_game(game_id: str) -> GameState:
+    """Look up a game by ID, raising the standard 404 if it does not exist."""
+    game_state = game_manager.get_game(game_id)
+    if game_state is None:
+        raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
+    return game_state
+
 # Configure logging early so startup hooks can log useful information
 _LOG_FILE = configure_root_logger(service_name="api", env_prefix="APP_")
 logger = logging.getLogger("app.main")
@@ -540,7 +660,7 @@ def create_game(game_id: Optional[str] = None):
     """Create a new game"""
     try:
         game_state = game_manager.create_game(game_id)
-        return game_state
+        return _state_response(game_state)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -562,27 +682,84 @@ def get_current_game():
     
     if not game_state:
         raise HTTPException(status_code=500, detail="No active game available")
-    return game_state
+    return _state_response(game_state)
 
 
 @app.get("/game/{game_id}", response_model=GameState)
 def get_game(game_id: str):
     """Get current game state"""
-    game_state = game_manager.get_game(game_id)
-    if not game_state:
-        raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
-    return game_state
+    game_state = _require_game(game_id)
+    # Agents poll this between moves; reuse the dump until the state changes
+    return _state_response(game_state)
+
+
+@app.get("/game/{game_id}/delta")
+def get_game_delta(game_id: str, since_version: int = 0):
+    """
+    Get what changed in the game state since a version.
+
+    Pass the ``version`` from the previous response as ``since_version``.
+    ``changed`` holds top-level fields to replace, ``players`` the players
+    whose state changed (merge by id), and ``appended`` the entries added to
+    ``events``, ``event_log`` and ``messages``. All three are empty when
+    nothing has happened since. If that version is unknown (e.g. 0 on the
+    first poll, or too old), ``changed`` is the full state and ``full`` is
+    true.
+    """
+    game_state = _require_game(game_id)
+    version = game_state.state_version
+    if since_version == version:
+        return {"version": version, "full": False, "changed": {}, "players": {}, "appended": {}}
+
+    with _CACHE_LOCK:
+        previous = _state_snapshots.get((game_id, since_version))
+    # Record this version so the client's next poll can diff against it
+    current = _state_snapshot(game_state)
+    if previous is None:
+        return _json_response(
+            f'{{"version":{version},"full":true,"changed":{game_state.cached_json()},'
+            f'"players":{{}},"appended":{{}}}}'
+        )
+
+    changed = {
+        field: value for field, value in current["fields"].items()
+        if previous["fields"].get(field) != value
+    }
+    previous_players = previous["players"]
+    players = {
+        player_id: player for player_id, player in current["players"].items()
+        if previous_players.get(player_id) != player
+    }
+    if not previous_players.keys() <= current["players"].keys():
+        # A player left the roster; merging by id cannot express that
+        changed["players"] = current["players"]
+        players = {}
+
+    appended = {}
+    for name, adapter in _DELTA_LOG_ADAPTERS.items():
+        log = getattr(game_state, name)
+        tail = _appended_entries(log, previous["logs"][name])
+        if tail is None:
+            changed[name] = adapter.dump_python(list(log), mode="json")
+        elif tail:
+            appended[name] = adapter.dump_python(tail, mode="json")
+
+    return _json_response(json.dumps({
+        "version": version,
+        "full": False,
+        "changed": changed,
+        "players": players,
+        "appended": appended,
+    }, separators=(",", ":")))
 
 
 @app.get("/game/{game_id}/statistics", response_model=GameStatistics)
 def get_game_statistics(game_id: str):
     """Return aggregated statistics for a completed or in-progress game."""
-    game_state = game_manager.get_game(game_id)
-    if not game_state:
-        raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
+    game_state = _require_game(game_id)
 
     aggregator = StatisticsAggregator(game_state)
-    return aggregator.aggregate()
+    return _json_response(aggregator.aggregate().model_dump_json())
 
 
 @app.get("/leaderboard", response_model=LeaderboardResponse)
@@ -619,7 +796,7 @@ def setup_team(
             team_type,
             player_positions
         )
-        return game_state
+        return _state_response(game_state)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -711,7 +888,7 @@ def place_players(
             request.team_id,
             request.positions
         )
-        return game_state
+        return _state_response(game_state)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -730,8 +907,9 @@ def start_game(
             game_state.team1_model = team1_model
         if team2_model:
             game_state.team2_model = team2_model
+        game_state.bump_version()
         lobby_manager.mark_game_playing(game_id)
-        return game_state
+        return _state_response(game_state)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -743,9 +921,7 @@ def execute_action(
     agent_ctx: Optional[AgentContext] = Depends(optional_agent_auth),
 ):
     """Execute a game action"""
-    game_state = game_manager.get_game(game_id)
-    if not game_state:
-        raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
+    game_state = _require_game(game_id)
     
     # Versus auth: confirm it's this agent's turn
     if agent_ctx and game_state.turn:
@@ -786,7 +962,7 @@ def execute_action(
             game_manager.end_turn(game_id)
             result.details["turn_ended"] = True
         
-        return result
+        return _json_response(result.model_dump_json())
         
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -808,9 +984,7 @@ def end_turn(
     or if team_id doesn't match the active team.
     """
     try:
-        game_state = game_manager.get_game(game_id)
-        if not game_state:
-            raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
+        game_state = _require_game(game_id)
 
         # Versus auth: use agent's team_id if available, override client param
         if agent_ctx:
@@ -825,7 +999,7 @@ def end_turn(
                 )
 
         game_state = game_manager.end_turn(game_id)
-        return game_state
+        return _state_response(game_state)
     except HTTPException:
         raise
     except Exception as e:
@@ -839,9 +1013,7 @@ def use_reroll(
     agent_ctx: Optional[AgentContext] = Depends(optional_agent_auth),
 ):
     """Use a team re-roll"""
-    game_state = game_manager.get_game(game_id)
-    if not game_state:
-        raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
+    game_state = _require_game(game_id)
     
     if agent_ctx and agent_ctx.team_id != team_id:
         raise HTTPException(status_code=403, detail="You can only use rerolls for your own team")
@@ -849,6 +1021,7 @@ def use_reroll(
     try:
         team = game_state.get_team_by_id(team_id)
         team.use_reroll()
+        game_state.bump_version()
         return {"success": True, "rerolls_remaining": team.rerolls_remaining}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -857,54 +1030,66 @@ def use_reroll(
 @app.get("/game/{game_id}/valid-actions", response_model=ValidActionsResponse)
 def get_valid_actions(game_id: str):
     """Get all valid actions for current game state"""
-    game_state = game_manager.get_game(game_id)
-    if not game_state:
-        raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
+    game_state = _require_game(game_id)
     
     if not game_state.turn:
         raise HTTPException(status_code=400, detail="Game not started")
+
+    cache_key = (game_id, game_state.state_version)
+    with _CACHE_LOCK:
+        cached = _valid_actions_cache.get(cache_key)
+    if cached is not None:
+        return _json_response(cached)
     
     active_team = game_state.get_active_team()
     
     # Get movable players (standing, has movement)
     movable_players = []
     blockable_targets = {}
+
+    # Bind hot lookups once; the loop below runs for every active player
+    players = game_state.players
+    positions = game_state.pitch.player_positions
+    # One pass over the pitch; each player then probes only its 8 neighbours
+    occupants = game_state.pitch.occupancy_grid()
+    # Targets are reported in pitch placement order, not neighbour-scan order
+    placement_order = {pid: index for index, pid in enumerate(positions)}
     
     for player_id in active_team.player_ids:
-        player = game_state.get_player(player_id)
+        player = players[player_id]
         
         if player.is_standing and player.movement_remaining > 0 and not player.has_acted:
             movable_players.append(player_id)
 
         # Find blockable targets for this player
         if player.is_standing and not player.has_acted:
-            player_pos = game_state.pitch.player_positions.get(player_id)
+            player_pos = positions.get(player_id)
             if player_pos:
+                team_id = player.team_id
+                px, py = player_pos.x, player_pos.y
                 targets = []
-                for adj_player_id in game_state.pitch.get_adjacent_players(player_pos):
-                    adj_player = game_state.get_player(adj_player_id)
-                    # Check adjacency (distance <= 1 in both x and y)
-                    adj_pos = game_state.pitch.player_positions.get(adj_player_id)
-                    if adj_pos:
-                        dx = abs(player_pos.x - adj_pos.x)
-                        dy = abs(player_pos.y - adj_pos.y)
-                        if dx <= 1 and dy <= 1 and adj_player.team_id != player.team_id and adj_player.is_active:
-                            targets.append(adj_player_id)
+                for dx, dy in ADJACENT_OFFSETS:
+                    adj_player_id = occupants.get((px + dx, py + dy))
+                    if adj_player_id is None:
+                        continue
+                    adj_player = players[adj_player_id]
+                    if adj_player.team_id != team_id and adj_player.is_active:
+                        targets.append(adj_player_id)
                 
                 if targets:
+                    targets.sort(key=placement_order.__getitem__)
                     blockable_targets[player_id] = targets
     
     # Pre-compute reachable squares for each movable player
-    from app.game.movement import MovementHandler
-    from app.game.dice import DiceRoller
-    movement_handler = MovementHandler(DiceRoller())
     reachable_squares: dict[str, list[dict]] = {}
     for player_id in movable_players:
         reachable_squares[player_id] = movement_handler.get_reachable_squares(
             game_state, player_id
         )
 
-    return ValidActionsResponse(
+    # Every field is built above from live game state, so skip validation
+    pitch = game_state.pitch
+    response = ValidActionsResponse.model_construct(
         current_team=active_team.id,
         phase=game_state.phase.value,
         can_charge=not game_state.turn.charge_used,
@@ -913,23 +1098,28 @@ def get_valid_actions(game_id: str):
         can_boot=not game_state.turn.boot_used,
         movable_players=movable_players,
         blockable_targets=blockable_targets,
-        ball_carrier=game_state.pitch.ball_carrier,
-        ball_on_ground=game_state.pitch.ball_position is not None and game_state.pitch.ball_carrier is None,
-        ball_position=game_state.pitch.ball_position,
+        ball_carrier=pitch.ball_carrier,
+        ball_on_ground=pitch.ball_on_ground,
+        ball_position=pitch.ball_position,
         reachable_squares=reachable_squares,
     )
 
+    content = response.model_dump_json()
+    with _CACHE_LOCK:
+        _valid_actions_cache[cache_key] = content
+        while len(_valid_actions_cache) > _VALID_ACTIONS_CACHE_SIZE:
+            _valid_actions_cache.popitem(last=False)
+    return _json_response(content)
+
 
 @app.get("/game/{game_id}/history")
 def get_history(game_id: str, limit: int = 50):
     """Get game event history"""
-    game_state = game_manager.get_game(game_id)
-    if not game_state:
-        raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
+    game_state = _require_game(game_id)
 
     return {
         "game_id": game_id,
-        "events": game_state.event_log[-limit:]
+        "events": game_state.recent_events(limit)
     }
 
 
@@ -967,9 +1157,8 @@ def export_game_log(game_id: str, format: str = "markdown"):
         from fastapi.responses import PlainTextResponse
         return PlainTextResponse(content=log_content, media_type="text/markdown")
     else:
-        from fastapi.responses import JSONResponse
-        import json
-        return JSONResponse(content=json.loads(log_content))
+        # Already a JSON document; no need to parse and re-encode it
+        return _json_response(log_content)
 
 
 @app.get("/game/{game_id}/suggest-path")
@@ -983,20 +1172,9 @@ def suggest_path(game_id: str, player_id: str, target_x: int, target_y: int):
     - Success probabilities
     - Total risk score
     """
-    game_state = game_manager.get_game(game_id)
-    if not game_state:
-        raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
+    game_state = _require_game(game_id)
     
     try:
-        from app.game.pathfinding import PathFinder
-        from app.game.movement import MovementHandler
-        from app.game.dice import DiceRoller
-        
-        # Create pathfinder
-        dice_roller = DiceRoller()
-        movement_handler = MovementHandler(dice_roller)
-        pathfinder = PathFinder(movement_handler)
-        
         # Generate suggestion
         target_pos = Position(x=target_x, y=target_y)
         suggestion = pathfinder.suggest_path(game_state, player_id, target_pos)
@@ -1007,6 +1185,28 @@ def suggest_path(game_id: str, player_id: str, target_x: int, target_y: int):
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@app.post("/game/{game_id}/suggest-paths")
+def suggest_paths(game_id: str, requests: list[PathRequest]):
+    """
+    Suggest paths for several players in one call.
+
+    Each entry gets the same result as /suggest-path, computed against a
+    single snapshot of the board. At most 32 entries are accepted per call.
+    """
+    if len(requests) > _MAX_PATH_REQUESTS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {_MAX_PATH_REQUESTS} path requests per call",
+        )
+
+    game_state = _require_game(game_id)
+
+    try:
+        return pathfinder.suggest_paths(game_state, requests)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @app.post("/game/{game_id}/join")
 def join_game(
     game_id: str,
@@ -1014,9 +1214,7 @@ def join_game(
     agent_ctx: Optional[AgentContext] = Depends(optional_agent_auth),
 ):
     """Mark a team as joined"""
-    game_state = game_manager.get_game(game_id)
-    if not game_state:
-        raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
+    game_state = _require_game(game_id)
     
     if agent_ctx and agent_ctx.team_id != team_id:
         raise HTTPException(status_code=403, detail="You can only join as your own team")
@@ -1051,9 +1249,7 @@ def send_message(
     agent_ctx: Optional[AgentContext] = Depends(optional_agent_auth),
 ):
     """Send a message in the game"""
-    game_state = game_manager.get_game(game_id)
-    if not game_state:
-        raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
+    game_state = _require_game(game_id)
     
     # If agent_ctx present, use authenticated identity instead of trusting query params
     if agent_ctx:
@@ -1070,42 +1266,50 @@ def send_message(
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@app.get("/game/{game_id}/messages")
+@app.get("/game/{game_id}/messages", response_model=GameMessagesResponse)
 def get_messages(game_id: str, turn_number: Optional[int] = None, limit: Optional[int] = None):
-    """Get messages from the game"""
-    game_state = game_manager.get_game(game_id)
-    if not game_state:
-        raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
-    
-    messages = game_state.messages
-    
-    # Filter by turn if specified
-    if turn_number is not None:
-        messages = [m for m in messages if m.turn_number == turn_number]
+    """
+    Get messages from the game.
+
+    Returns the game id, a message count and the messages, oldest first.
+    Filter with turn_number; limit keeps only the newest entries.
+    """
+    game_state = _require_game(game_id)
     
-    # Apply limit if specified
-    if limit is not None:
-        messages = messages[-limit:]
+    if limit is not None and limit > 0:
+        # Walk back from the newest message so only the requested tail is
+        # touched, filtering by turn on the way
+        newest = reversed(game_state.messages)
+        if turn_number is not None:
+            newest = (m for m in newest if m.turn_number == turn_number)
+        messages = list(itertools.islice(newest, limit))
+        messages.reverse()
+    else:
+        if turn_number is not None:
+            messages = game_state.messages_for_turn(turn_number)
+        else:
+            messages = list(game_state.messages)
+        # As with [-limit:], 0 keeps everything and a negative limit drops
+        # that many of the oldest messages
+        if limit:
+            messages = messages[-limit:]
     
-    return {
-        "game_id": game_id,
-        "count": len(messages),
-        "messages": messages
-    }
+    # Chat history can run to thousands of entries; encode it in one
+    # pydantic-core pass instead of through FastAPI's jsonable_encoder
+    response = GameMessagesResponse(game_id=game_id, count=len(messages), messages=messages)
+    return _json_response(response.model_dump_json())
 
 
 @app.post("/game/{game_id}/reset", response_model=GameState)
 def reset_game(game_id: str):
     """Reset game to setup phase, preserving join status and message history"""
-    game_state = game_manager.get_game(game_id)
-    if not game_state:
-        raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
+    game_state = _require_game(game_id)
 
     try:
         game_manager._record_result_if_concluded(game_state)
         game_state.reset_to_setup()
         game_manager._recorded_games.discard(game_id)
-        return game_state
+        return _state_response(game_state)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -1117,9 +1321,7 @@ def rematch_game(game_id: str):
     Records the completed game result to the leaderboard before resetting.
     The 'Play Again' button in the UI calls this endpoint.
     """
-    game_state = game_manager.get_game(game_id)
-    if not game_state:
-        raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
+    game_state = _require_game(game_id)
 
     try:
         # ── NEW: record result before we wipe the state ──────────────
@@ -1140,13 +1342,13 @@ def rematch_game(game_id: str):
             fresh_state.team2_joined = True
             fresh_state.team1_ready = True
             fresh_state.team2_ready = True
-            return game_manager.start_game(game_id)
+            return _state_response(game_manager.start_game(game_id))
 
         # Fallback for interactive/custom games: reset to setup and let clients configure
         game_state.reset_to_setup()
         game_manager._recorded_games.discard(game_id)
         game_manager._persist_game(game_state)
-        return game_state
+        return _state_response(game_state)
 
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
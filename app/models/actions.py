@@ -1,17 +1,55 @@
 """Action request and result models"""
-from typing import Optional, Any
-from pydantic import BaseModel, Field, model_validator
+from dataclasses import dataclass, field
+from typing import Annotated, Optional, Any
+from pydantic import BaseModel, Field, computed_field, model_validator
 from app.models.enums import ActionType, BlockResult, PassResult
 from app.models.pitch import Position
 
 
-class DiceRoll(BaseModel):
-    """Result of a dice roll"""
-    type: str = Field(..., description="Type of roll (dodge, block, pass, etc.)")
-    result: int = Field(..., description="Dice result")
-    target: Optional[int] = Field(None, description="Target number needed")
-    success: bool = Field(..., description="Whether the roll succeeded")
-    modifiers: dict[str, int] = Field(default_factory=dict, description="Applied modifiers")
+@dataclass(slots=True, frozen=True, kw_only=True)
+class DiceRoll:
+    """Result of a dice roll
+
+    A slotted dataclass rather than a BaseModel: several are created per
+    action, and Pydantic still validates and serialises it inside models.
+    """
+    type: Annotated[str, Field(description="Type of roll (dodge, block, pass, etc.)")]
+    result: Annotated[int, Field(description="Dice result")]
+    target: Annotated[Optional[int], Field(description="Target number needed")] = None
+    success: Annotated[bool, Field(description="Whether the roll succeeded")]
+    modifiers: Annotated[dict[str, int], Field(description="Applied modifiers")] = field(
+        default_factory=dict
+    )
+
+
+# Action type -> (fields of which at least one must be set, error if none is).
+# STAND_UP doesn't require additional parameters.
+_ACTION_REQUIREMENTS: dict[ActionType, tuple[tuple[str, ...], str]] = {
+    ActionType.MOVE: (
+        ("target_position",),
+        "MOVE action requires target_position",
+    ),
+    ActionType.SCUFFLE: (
+        ("target_player_id",),
+        "SCUFFLE action requires target_player_id (adjacent opponent)",
+    ),
+    ActionType.CHARGE: (
+        ("target_player_id",),
+        "CHARGE action requires target_player_id (opponent to block)",
+    ),
+    ActionType.HURL: (
+        ("target_receiver_id", "target_position"),
+        "HURL action requires target_receiver_id or target_position",
+    ),
+    ActionType.QUICK_PASS: (
+        ("target_receiver_id",),
+        "QUICK_PASS action requires target_receiver_id (adjacent teammate)",
+    ),
+    ActionType.BOOT: (
+        ("target_player_id",),
+        "BOOT action requires target_player_id (prone adjacent opponent)",
+    ),
+}
 
 
 class ActionRequest(BaseModel):
@@ -44,40 +82,18 @@ class ActionRequest(BaseModel):
         """
         action = self.action_type
 
-        # MOVE requires path
-        if action == ActionType.MOVE:
-            if not self.target_position:
-                if self.path:
-                    self.target_position = self.path[-1]
-                else:
-                    raise ValueError("MOVE action requires target_position")
-
-        # SCUFFLE (block) requires target_player_id
-        elif action == ActionType.SCUFFLE:
-            if not self.target_player_id:
-                raise ValueError("SCUFFLE action requires target_player_id (adjacent opponent)")
-
-        # CHARGE (blitz) requires target_player_id (and optionally target_position for movement)
-        elif action == ActionType.CHARGE:
-            if not self.target_player_id:
-                raise ValueError("CHARGE action requires target_player_id (opponent to block)")
-
-        # HURL (pass) requires target_receiver_id or target_position
-        elif action == ActionType.HURL:
-            if not self.target_receiver_id and not self.target_position:
-                raise ValueError("HURL action requires target_receiver_id or target_position")
-
-        # QUICK_PASS (hand-off) requires target_receiver_id
-        elif action == ActionType.QUICK_PASS:
-            if not self.target_receiver_id:
-                raise ValueError("QUICK_PASS action requires target_receiver_id (adjacent teammate)")
-
-        # BOOT (foul) requires target_player_id
-        elif action == ActionType.BOOT:
-            if not self.target_player_id:
-                raise ValueError("BOOT action requires target_player_id (prone adjacent opponent)")
-
-        # STAND_UP doesn't require additional parameters
+        # A MOVE may give only a path; its last square is the target
+        if action == ActionType.MOVE and not self.target_position and self.path:
+            self.target_position = self.path[-1]
+
+        requirement = _ACTION_REQUIREMENTS.get(action)
+        if requirement is not None:
+            fields, message = requirement
+            for name in fields:
+                if getattr(self, name):
+                    break
+            else:
+                raise ValueError(message)
 
         return self
 
@@ -136,12 +152,6 @@ class ValidActionsResponse(BaseModel):
     can_quick_pass: bool  # was can_hand_off
     can_boot: bool  # was can_foul
 
-    # Legacy field names maintained for backwards compatibility with the API
-    can_blitz: bool | None = None
-    can_pass: bool | None = None
-    can_hand_off: bool | None = None
-    can_foul: bool | None = None
-
     # Players who can act
     movable_players: list[str] = Field(default_factory=list)
     blockable_targets: dict[str, list[str]] = Field(
@@ -161,15 +171,27 @@ class ValidActionsResponse(BaseModel):
         description="Per-player reachable destination squares this turn"
     )
 
-    @model_validator(mode="after")
-    def populate_legacy_flags(self) -> "ValidActionsResponse":
-        """Ensure legacy flag names mirror the new Discworld terminology."""
-
-        self.can_blitz = self.can_charge
-        self.can_pass = self.can_hurl
-        self.can_hand_off = self.can_quick_pass
-        self.can_foul = self.can_boot
-        return self
+    # Legacy field names maintained for backwards compatibility with the API.
+    # Computed on serialisation, so building a response doesn't pay for them.
+    @computed_field
+    @property
+    def can_blitz(self) -> bool:
+        return self.can_charge
+
+    @computed_field
+    @property
+    def can_pass(self) -> bool:
+        return self.can_hurl
+
+    @computed_field
+    @property
+    def can_hand_off(self) -> bool:
+        return self.can_quick_pass
+
+    @computed_field
+    @property
+    def can_foul(self) -> bool:
+        return self.can_boot
 
 
 class BudgetStatus(BaseModel):
@@ -8,7 +8,7 @@ replacing the simple string-based event_log with rich, queryable event data.
 from datetime import datetime
 from enum import Enum
 from typing import Optional, Any
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
 
 from app.models.actions import DiceRoll
 from app.models.pitch import Position
@@ -111,6 +111,16 @@ class GameEvent(BaseModel):
     )
 
 
+# Built once and reused, so a whole event log is dumped in a single
+# pydantic-core call rather than one model_dump per event
+GameEventListAdapter = TypeAdapter(list[GameEvent])
+
+
+def dump_events(events: list[GameEvent]) -> list[dict[str, Any]]:
+    """Dump a list of events to JSON-compatible dicts."""
+    return GameEventListAdapter.dump_python(events, mode="json")
+
+
 class TurnoverReason(str, Enum):
     """Specific reasons for turnovers."""
     FAILED_DODGE = "failed_dodge"
@@ -1,8 +1,10 @@
 """Game state model"""
+from collections import deque
 from typing import Optional, TYPE_CHECKING
 from datetime import datetime, timezone
+import itertools
 import logging
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, ValidationInfo, field_validator
 from app.models.enums import GamePhase, PlayerState, TeamType
 from app.models.pitch import Pitch, Position
 from app.models.player import Player
@@ -15,6 +17,15 @@ if TYPE_CHECKING:
 event_logger = logging.getLogger("app.game.events")
 message_logger = logging.getLogger("app.game.chat")
 
+# Process-wide counter so state versions are never reused, even when a game
+# id is recreated (e.g. demo rematch) and its old cached views linger.
+_state_versions = itertools.count(1)
+
+# Cap on the legacy string event log; it is only ever read as a recent tail
+EVENT_LOG_MAXLEN = 10_000
+# Cap on chat history; far above what a full match produces
+MESSAGE_LOG_MAXLEN = 10_000
+
 
 class GameMessage(BaseModel):
     """Message sent during a game"""
@@ -26,6 +37,13 @@ class GameMessage(BaseModel):
     game_phase: str = Field(description="Phase when message was sent")
 
 
+class GameMessagesResponse(BaseModel):
+    """Messages returned by the messages endpoint"""
+    game_id: str
+    count: int = Field(description="Number of messages returned")
+    messages: list[GameMessage]
+
+
 class TurnState(BaseModel):
     """Current turn tracking"""
     half: int = Field(1, ge=1, le=2, description="Current half (1 or 2)")
@@ -78,8 +96,53 @@ class GameState(BaseModel):
 
     # Game history
     events: list["GameEvent"] = Field(default_factory=list, description="Structured event log")
-    event_log: list[str] = Field(default_factory=list, description="Legacy string event log (deprecated)")
-    messages: list[GameMessage] = Field(default_factory=list)
+    event_log: deque[str] = Field(
+        default_factory=lambda: deque(maxlen=EVENT_LOG_MAXLEN),
+        description="Legacy string event log (deprecated), keeps the most recent entries",
+    )
+    messages: deque[GameMessage] = Field(
+        default_factory=lambda: deque(maxlen=MESSAGE_LOG_MAXLEN),
+        description="Chat history, keeps the most recent messages",
+    )
+
+    # Bumped on every mutation so derived views can be cached per version
+    _state_version: int = PrivateAttr(default_factory=lambda: next(_state_versions))
+    # (state_version, JSON dump) of the last serialisation
+    _json_cache: Optional[tuple[int, str]] = PrivateAttr(default=None)
+
+    @field_validator("event_log", "messages")
+    @classmethod
+    def bound_logs(cls, v: deque, info: ValidationInfo) -> deque:
+        """Restore the ring-buffer cap, which is lost when loading from JSON"""
+        maxlen = EVENT_LOG_MAXLEN if info.field_name == "event_log" else MESSAGE_LOG_MAXLEN
+        if v.maxlen != maxlen:
+            return deque(v, maxlen=maxlen)
+        return v
+
+    # The version helpers below run on every mutation and every poll, so they
+    # index __pydantic_private__ directly. Reading a private attribute the
+    # normal way only reaches BaseModel.__getattr__ after a failed lookup,
+    # which costs ~25x more than the dict access.
+
+    @property
+    def state_version(self) -> int:
+        """Opaque version number that changes whenever the state is mutated"""
+        return self.__pydantic_private__["_state_version"]
+
+    def bump_version(self) -> None:
+        """Invalidate cached views of this state after a mutation"""
+        self.__pydantic_private__["_state_version"] = next(_state_versions)
+
+    def cached_json(self) -> str:
+        """JSON dump of the full state, reused until the next mutation"""
+        private = self.__pydantic_private__
+        version = private["_state_version"]
+        cached = private["_json_cache"]
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        dumped = self.model_dump_json()
+        private["_json_cache"] = (version, dumped)
+        return dumped
     
     @property
     def players_ready(self) -> bool:
@@ -93,43 +156,52 @@ class GameState(BaseModel):
     
     def get_active_team(self) -> Team:
         """Get the currently active team"""
-        if not self.turn:
+        # Called on nearly every request; read each attribute once
+        turn = self.turn
+        if turn is None:
             raise ValueError("No active turn")
         
-        if self.turn.active_team_id == self.team1.id:
-            return self.team1
-        elif self.turn.active_team_id == self.team2.id:
-            return self.team2
-        else:
-            raise ValueError(f"Invalid active team ID: {self.turn.active_team_id}")
+        active_team_id = turn.active_team_id
+        team1 = self.team1
+        if active_team_id == team1.id:
+            return team1
+        team2 = self.team2
+        if active_team_id == team2.id:
+            return team2
+        raise ValueError(f"Invalid active team ID: {active_team_id}")
     
     def get_inactive_team(self) -> Team:
         """Get the currently inactive team"""
-        if not self.turn:
+        turn = self.turn
+        if turn is None:
             raise ValueError("No active turn")
         
-        if self.turn.active_team_id == self.team1.id:
+        team1 = self.team1
+        if turn.active_team_id == team1.id:
             return self.team2
-        else:
-            return self.team1
+        return team1
     
     def get_team_by_id(self, team_id: str) -> Team:
         """Get team by ID"""
-        if team_id == self.team1.id:
-            return self.team1
-        elif team_id == self.team2.id:
-            return self.team2
-        else:
-            raise ValueError(f"Team not found: {team_id}")
+        team1 = self.team1
+        if team_id == team1.id:
+            return team1
+        team2 = self.team2
+        if team_id == team2.id:
+            return team2
+        raise ValueError(f"Team not found: {team_id}")
     
     def get_player(self, player_id: str) -> Player:
         """Get player by ID"""
-        if player_id not in self.players:
-            raise ValueError(f"Player not found: {player_id}")
-        return self.players[player_id]
+        try:
+            return self.players[player_id]
+        except KeyError:
+            raise ValueError(f"Player not found: {player_id}") from None
     
     def get_team_players(self, team_id: str) -> list[Player]:
         """Get all players for a team"""
+        # Filter on team_id rather than walking Team.player_ids: states built
+        # directly (e.g. in tests) add players without touching the roster
         return [p for p in self.players.values() if p.team_id == team_id]
     
     def is_player_on_active_team(self, player_id: str) -> bool:
@@ -142,57 +214,78 @@ class GameState(BaseModel):
     def add_event(self, event: str) -> None:
         """Add event to game log"""
         self.event_log.append(event)
-        turn_number = self.turn.team_turn if self.turn else "-"
-        active_team = self.turn.active_team_id if self.turn else "-"
+        self.bump_version()
+        # Skip gathering the log arguments when the events logger is silenced
+        if not event_logger.isEnabledFor(logging.INFO):
+            return
+        turn = self.turn
         event_logger.info(
             "[%s] phase=%s turn=%s active_team=%s | %s",
             self.game_id,
             self.phase.value,
-            turn_number,
-            active_team,
+            turn.team_turn if turn else "-",
+            turn.active_team_id if turn else "-",
             event,
         )
     
+    def recent_events(self, limit: int) -> list[str]:
+        """Return the last ``limit`` legacy log entries, oldest first
+
+        Matches slicing with ``[-limit:]``: 0 returns everything and a
+        negative limit drops that many of the oldest entries.
+        """
+        if limit <= 0:
+            return list(itertools.islice(self.event_log, -limit, None))
+        tail = list(itertools.islice(reversed(self.event_log), limit))
+        tail.reverse()
+        return tail
+    
     def switch_turn(self) -> None:
         """Switch to the other team's turn"""
-        if not self.turn:
+        turn = self.turn
+        if not turn:
             raise ValueError("No active turn")
+
+        self.bump_version()
         
         # Reset turnover flag at the start
-        self.turn.turnover_ended_turn = False
+        turn.turnover_ended_turn = False
         
         # Transition from KICKOFF to PLAYING after first turn
         if self.phase == GamePhase.KICKOFF:
             self.phase = GamePhase.PLAYING
         
+        # Resolve both sides once for the player and re-roll resets below
+        team1 = self.team1
+        old_team = self.get_active_team()
+        new_team = self.team2 if old_team is team1 else team1
+        
         # Reset active team's players
-        active_team = self.get_active_team()
-        for player in self.get_team_players(active_team.id):
-            player.reset_turn()
+        old_team_id = old_team.id
+        for player in self.players.values():
+            if player.team_id == old_team_id:
+                player.reset_turn()
         
         # Reset action tracking
-        self.turn.charge_used = False
-        self.turn.hurl_used = False
-        self.turn.quick_pass_used = False
-        self.turn.boot_used = False
+        turn.charge_used = False
+        turn.hurl_used = False
+        turn.quick_pass_used = False
+        turn.boot_used = False
         
         # Switch to other team
-        if self.turn.active_team_id == self.team1.id:
-            self.turn.active_team_id = self.team2.id
-        else:
-            self.turn.active_team_id = self.team1.id
+        turn.active_team_id = new_team.id
+        if new_team is team1:
             # Increment turn counter when returning to team 1
-            self.turn.team_turn += 1
+            turn.team_turn += 1
         
         # Reset team re-rolls
-        active_team = self.get_active_team()
-        active_team.reset_rerolls()
+        new_team.reset_rerolls()
         
         # Check if half is over
-        if self.turn.team_turn > 8:
+        if turn.team_turn > 8:
             self.end_half()
             # After half 1 ends, transition from INTERMISSION back to PLAYING for half 2
-            if self.turn.half == 2 and self.phase == GamePhase.INTERMISSION:
+            if turn.half == 2 and self.phase == GamePhase.INTERMISSION:
                 self.phase = GamePhase.PLAYING
     
     def reset_for_kickoff(self) -> None:
@@ -259,6 +352,8 @@ class GameState(BaseModel):
     def add_message(self, sender_id: str, sender_name: str, content: str) -> GameMessage:
         """Add a message to the game"""
         turn_number = self.turn.team_turn if self.turn else None
+        # Validated on purpose: for a model this small (with a default_factory
+        # timestamp) pydantic-core's validator is faster than model_construct
         message = GameMessage(
             sender_id=sender_id,
             sender_name=sender_name,
@@ -267,17 +362,24 @@ class GameState(BaseModel):
             game_phase=self.phase.value
         )
         self.messages.append(message)
-        message_logger.info(
-            "[%s] %s (%s) turn=%s phase=%s | %s",
-            self.game_id,
-            sender_name,
-            sender_id,
-            turn_number if turn_number is not None else "-",
-            self.phase.value,
-            content,
-        )
+        self.bump_version()
+        if message_logger.isEnabledFor(logging.INFO):
+            message_logger.info(
+                "[%s] %s (%s) turn=%s phase=%s | %s",
+                self.game_id,
+                sender_name,
+                sender_id,
+                turn_number if turn_number is not None else "-",
+                self.phase.value,
+                content,
+            )
         return message
     
+    def messages_for_turn(self, turn_number: Optional[int]) -> list[GameMessage]:
+        """Messages sent during a given turn, in order"""
+        # The log is bounded by MESSAGE_LOG_MAXLEN, so a scan stays cheap
+        return [m for m in self.messages if m.turn_number == turn_number]
+    
     def reset_to_setup(self) -> None:
         """Reset game to setup phase, preserving join status and messages"""
         # Clear pitch
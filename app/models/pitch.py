@@ -3,6 +3,12 @@ from typing import Optional
 from pydantic import BaseModel, Field, field_validator
 
 
+# (dx, dy) offsets of the eight squares surrounding a position
+ADJACENT_OFFSETS: tuple[tuple[int, int], ...] = tuple(
+    (dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy
+)
+
+
 class Position(BaseModel):
     """Position on the pitch (26x15 grid)"""
     x: int = Field(..., ge=0, lt=26, description="X coordinate (0-25)")
@@ -14,7 +20,9 @@ class Position(BaseModel):
         return self.x == other.x and self.y == other.y
     
     def __hash__(self):
-        return hash((self.x, self.y))
+        # Coordinates are bounded, so this is a perfect hash over the grid
+        # and avoids building a tuple per call
+        return self.x * 15 + self.y
     
     def distance_to(self, other: "Position") -> int:
         """Calculate Manhattan distance to another position"""
@@ -46,10 +54,18 @@ class Pitch(BaseModel):
                 raise ValueError("Ball position must be within pitch bounds (0-25, 0-14)")
         return v
     
+    @property
+    def ball_on_ground(self) -> bool:
+        """Check if the ball is loose on the pitch (placed, nobody holding it)"""
+        return self.ball_position is not None and self.ball_carrier is None
+    
     def get_player_at(self, pos: Position) -> Optional[str]:
         """Get player ID at a specific position"""
+        # Compare coordinates directly; Position.__eq__ is a Python-level call
+        # per player and this runs for every square a move or path touches
+        x, y = pos.x, pos.y
         for player_id, player_pos in self.player_positions.items():
-            if player_pos == pos:
+            if player_pos.x == x and player_pos.y == y:
                 return player_id
         return None
     
@@ -59,11 +75,24 @@ class Pitch(BaseModel):
     
     def get_adjacent_players(self, pos: Position) -> list[str]:
         """Get all player IDs adjacent to a position"""
-        adjacent = []
-        for player_id, player_pos in self.player_positions.items():
-            if player_pos.is_adjacent(pos):
-                adjacent.append(player_id)
-        return adjacent
+        # Same test as Position.is_adjacent, inlined to skip a method call
+        # (and its __eq__) per player on every tackle-zone and assist count
+        x, y = pos.x, pos.y
+        return [
+            player_id
+            for player_id, player_pos in self.player_positions.items()
+            if -1 <= player_pos.x - x <= 1
+            and -1 <= player_pos.y - y <= 1
+            and (player_pos.x != x or player_pos.y != y)
+        ]
+    
+    def occupancy_grid(self) -> dict[tuple[int, int], str]:
+        """Snapshot of occupied squares: (x, y) -> player ID.
+
+        Lets callers probing many squares (e.g. every player's neighbours)
+        pay for one pass over the pitch instead of one per lookup.
+        """
+        return {(pos.x, pos.y): player_id for player_id, pos in self.player_positions.items()}
     
     def move_player(self, player_id: str, new_pos: Position) -> None:
         """Move a player to a new position"""
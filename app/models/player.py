@@ -1,8 +1,26 @@
 """Player models and statistics"""
-from typing import Optional
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Annotated, Optional
 from pydantic import BaseModel, Field
 from app.models.enums import PlayerState, SkillType
 
+# Bound once: looking members up on the enum class costs more than the
+# comparison itself, and these checks run per player in every board scan
+_STANDING = PlayerState.STANDING
+_ACTIVE_STATES = frozenset({PlayerState.STANDING, PlayerState.PRONE})
+
+
+@lru_cache(maxsize=None)
+def _target_number(characteristic: str) -> int:
+    """Parse a characteristic like '3+' into its target number.
+
+    Cached on the string rather than on the position: roster templates are
+    shared and can be copied or edited, and there are only a handful of
+    distinct values.
+    """
+    return int(characteristic.replace('+', ''))
+
 
 class PlayerPosition(BaseModel):
     """Player roster position definition"""
@@ -19,17 +37,37 @@ class PlayerPosition(BaseModel):
     secondary: list[str] = Field(default_factory=list, description="Secondary skill categories")
     is_star_player: bool = Field(default=False, description="True for unique named star players")
 
+    @property
+    def ag_target(self) -> int:
+        """Agility as a target number (e.g., '3+' -> 3)"""
+        return _target_number(self.ag)
+
+    @property
+    def pa_target(self) -> int:
+        """Passing ability as a target number"""
+        return _target_number(self.pa)
 
-class Player(BaseModel):
-    """Individual player instance in a game"""
+    @property
+    def av_target(self) -> int:
+        """Armour value as a target number"""
+        return _target_number(self.av)
+
+
+@dataclass(slots=True, kw_only=True)
+class Player:
+    """Individual player instance in a game
+
+    A slotted dataclass rather than a BaseModel: its fields are written on
+    every step of a move and on every turn reset, and plain attribute
+    assignment skips BaseModel.__setattr__. Pydantic still validates and
+    serialises it inside GameState.
+    """
     id: str
     team_id: str
     position: PlayerPosition
-    number: Optional[int] = Field(
-        default=None,
-        ge=1,
-        description="Jersey number used for display/logging",
-    )
+    number: Annotated[
+        Optional[int], Field(ge=1, description="Jersey number used for display/logging")
+    ] = None
 
     # Current state
     state: PlayerState = PlayerState.STANDING
@@ -39,11 +77,17 @@ class Player(BaseModel):
     has_acted: bool = False
 
     # Skills and modifications
-    skills: list[SkillType] = Field(default_factory=list)
+    skills: list[SkillType] = field(default_factory=list)
 
     # Injuries and effects
     stunned_until_turn: Optional[int] = None
 
+    def __post_init__(self) -> None:
+        # Field(ge=1) is only enforced when pydantic validates the player;
+        # direct construction goes through the dataclass __init__
+        if self.number is not None and self.number < 1:
+            raise ValueError(f"Player number must be at least 1, got {self.number}")
+
     @property
     def position_name(self) -> str:
         """Return the roster role name for this player."""
@@ -72,12 +116,12 @@ class Player(BaseModel):
     @property
     def is_active(self) -> bool:
         """Check if player can take actions"""
-        return self.state in [PlayerState.STANDING, PlayerState.PRONE]
+        return self.state in _ACTIVE_STATES
     
     @property
     def is_standing(self) -> bool:
         """Check if player is standing"""
-        return self.state == PlayerState.STANDING
+        return self.state == _STANDING
     
     @property
     def movement_remaining(self) -> int:
@@ -131,12 +175,12 @@ class Player(BaseModel):
     
     def get_agility_target(self) -> int:
         """Parse agility string to target number (e.g., '3+' -> 3)"""
-        return int(self.position.ag.replace('+', ''))
+        return self.position.ag_target
     
     def get_passing_target(self) -> int:
         """Parse passing ability string to target number"""
-        return int(self.position.pa.replace('+', ''))
+        return self.position.pa_target
     
     def get_armor_value(self) -> int:
         """Parse armor value string to target number"""
-        return int(self.position.av.replace('+', ''))
+        return self.position.av_target
@@ -1,4 +1,5 @@
 """Team models and rosters"""
+from functools import cached_property
 from typing import Optional
 from pydantic import BaseModel, Field
 from app.models.enums import TeamType, SkillType
@@ -320,6 +321,14 @@ class TeamRoster(BaseModel):
     reroll_cost: int
     max_rerolls: int = 8
 
+    @cached_property
+    def position_keys_by_role(self) -> dict[str, str]:
+        """Map each role name to its position key (first key wins)"""
+        keys: dict[str, str] = {}
+        for key, position in self.positions.items():
+            keys.setdefault(position.role, key)
+        return keys
+
 
 # Pre-defined team rosters
 TEAM_ROSTERS = {
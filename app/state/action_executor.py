@@ -17,6 +17,26 @@ _EJECTED_STATES = frozenset({
     PlayerState.SENT_OFF,
 })
 
+# Once-per-turn actions -> (TurnState flag, error when already used).
+# The handler sets the flag once the action resolves.
+_TURN_LIMITED_ACTIONS: dict[ActionType, tuple[str, str]] = {
+    ActionType.CHARGE: ("charge_used", "Charge already used this turn"),
+    ActionType.HURL: ("hurl_used", "Hurl already used this turn"),
+    ActionType.QUICK_PASS: ("quick_pass_used", "Quick pass already used this turn"),
+    ActionType.BOOT: ("boot_used", "Boot already used this turn"),
+}
+
+
+def _turn_limit_refusal(game_state: GameState, action_type: ActionType) -> Optional[ActionResult]:
+    """Refusal for a once-per-turn action that can't be taken now, else None"""
+    turn = game_state.turn
+    if not turn:
+        return ActionResult(success=False, message="No active turn")
+    flag, used_message = _TURN_LIMITED_ACTIONS[action_type]
+    if getattr(turn, flag):
+        return ActionResult(success=False, message=used_message)
+    return None
+
 
 class ActionExecutor:
     """Executes validated actions and updates game state"""
@@ -26,6 +46,17 @@ class ActionExecutor:
         self.movement = MovementHandler(self.dice)
         self.ball = BallHandler(self.dice)
         self.combat = CombatHandler(self.dice)
+
+        # Action type -> bound handler, resolved once per executor
+        self._handlers = {
+            ActionType.MOVE: self._execute_move,
+            ActionType.STAND_UP: self._execute_stand_up,
+            ActionType.SCUFFLE: self._execute_scuffle,
+            ActionType.CHARGE: self._execute_charge,
+            ActionType.HURL: self._execute_hurl,
+            ActionType.QUICK_PASS: self._execute_quick_pass,
+            ActionType.BOOT: self._execute_boot,
+        }
     
     def execute_action(
         self,
@@ -33,34 +64,22 @@ class ActionExecutor:
         action: ActionRequest
     ) -> ActionResult:
         """Execute an action and return the result"""
-        
-        if action.action_type == ActionType.MOVE:
-            return self._execute_move(game_state, action)
-        
-        elif action.action_type == ActionType.STAND_UP:
-            return self._execute_stand_up(game_state, action)
-        
-        elif action.action_type == ActionType.SCUFFLE:
-            return self._execute_scuffle(game_state, action)
-
-        elif action.action_type == ActionType.CHARGE:
-            return self._execute_charge(game_state, action)
-
-        elif action.action_type == ActionType.HURL:
-            return self._execute_hurl(game_state, action)
-
-        elif action.action_type == ActionType.QUICK_PASS:
-            return self._execute_quick_pass(game_state, action)
-
-        elif action.action_type == ActionType.BOOT:
-            return self._execute_boot(game_state, action)
-        
-        else:
+        handler = self._handlers.get(action.action_type)
+        if handler is None:
             return ActionResult(
                 success=False,
                 message=f"Unknown action type: {action.action_type}"
             )
 
+        try:
+            return handler(game_state, action)
+        finally:
+            # Even failed actions can change state (e.g. a failed dodge knocks
+            # the player down), so invalidate cached views once the handler
+            # is done; bumping earlier lets a concurrent read cache a
+            # half-applied state under the new version.
+            game_state.bump_version()
+
     def _get_pitch_position(self, game_state: GameState, player_id: str):
         """Fetch a player's current position on the pitch if available."""
         return game_state.pitch.player_positions.get(player_id)
@@ -328,7 +347,9 @@ class ActionExecutor:
 
         # Check for turnover - if ball carrier is knocked down
         # Only turnover if OWN ball carrier (attacker) goes down, not opponent's
-        if defender_down and game_state.pitch.ball_carrier == defender.id:
+        # At most one of them can be carrying, so read the carrier once
+        ball_carrier = game_state.pitch.ball_carrier
+        if defender_down and ball_carrier == defender.id:
             drop_pos = defender_pos
             game_state.pitch.drop_ball()
             self.ball.scatter_ball(game_state)
@@ -337,7 +358,7 @@ class ActionExecutor:
             if drop_pos:
                 logger.log_drop(defender.id, drop_pos, "knocked down")
 
-        if attacker_down and game_state.pitch.ball_carrier == attacker.id:
+        elif attacker_down and ball_carrier == attacker.id:
             drop_pos = attacker_pos
             game_state.pitch.drop_ball()
             self.ball.scatter_ball(game_state)
@@ -358,11 +379,9 @@ class ActionExecutor:
     
     def _execute_charge(self, game_state: GameState, action: ActionRequest) -> ActionResult:
         """Execute a charge action (move + scuffle)"""
-        if not game_state.turn:
-            return ActionResult(success=False, message="No active turn")
-
-        if game_state.turn.charge_used:
-            return ActionResult(success=False, message="Charge already used this turn")
+        refusal = _turn_limit_refusal(game_state, ActionType.CHARGE)
+        if refusal:
+            return refusal
 
         logger = EventLogger(game_state)
         player = game_state.get_player(action.player_id)
@@ -473,15 +492,16 @@ class ActionExecutor:
         if attacker_down and attacker_pos:
             logger.log_knockdown(player.id, attacker_pos)
 
-        # Check for turnover
-        if defender_down and game_state.pitch.ball_carrier == defender.id:
+        # Check for turnover; at most one of them can be carrying
+        ball_carrier = game_state.pitch.ball_carrier
+        if defender_down and ball_carrier == defender.id:
             drop_pos = defender_pos
             game_state.pitch.drop_ball()
             result.ball_dropped = True
             if drop_pos:
                 logger.log_drop(defender.id, drop_pos, "knocked down")
 
-        if attacker_down and game_state.pitch.ball_carrier == player.id:
+        elif attacker_down and ball_carrier == player.id:
             drop_pos = attacker_pos
             game_state.pitch.drop_ball()
             result.turnover = True
@@ -501,11 +521,9 @@ class ActionExecutor:
     
     def _execute_hurl(self, game_state: GameState, action: ActionRequest) -> ActionResult:
         """Execute a hurl action (throw ball)"""
-        if not game_state.turn:
-            return ActionResult(success=False, message="No active turn")
-
-        if game_state.turn.hurl_used:
-            return ActionResult(success=False, message="Hurl already used this turn")
+        refusal = _turn_limit_refusal(game_state, ActionType.HURL)
+        if refusal:
+            return refusal
 
         if not action.target_position:
             return ActionResult(success=False, message="No target position for pass")
@@ -597,11 +615,9 @@ class ActionExecutor:
 
     def _execute_quick_pass(self, game_state: GameState, action: ActionRequest) -> ActionResult:
         """Execute a quick pass action (short hand-off)"""
-        if not game_state.turn:
-            return ActionResult(success=False, message="No active turn")
-
-        if game_state.turn.quick_pass_used:
-            return ActionResult(success=False, message="Quick pass already used this turn")
+        refusal = _turn_limit_refusal(game_state, ActionType.QUICK_PASS)
+        if refusal:
+            return refusal
 
         if not action.target_receiver_id:
             return ActionResult(success=False, message="No receiver specified")
@@ -634,11 +650,9 @@ class ActionExecutor:
 
     def _execute_boot(self, game_state: GameState, action: ActionRequest) -> ActionResult:
         """Execute a boot action (foul/kick opponent when down)"""
-        if not game_state.turn:
-            return ActionResult(success=False, message="No active turn")
-
-        if game_state.turn.boot_used:
-            return ActionResult(success=False, message="Boot already used this turn")
+        refusal = _turn_limit_refusal(game_state, ActionType.BOOT)
+        if refusal:
+            return refusal
 
         if not action.target_player_id:
             return ActionResult(success=False, message="No target player specified")
@@ -8,6 +8,7 @@ from app.models.team import Team, TEAM_ROSTERS
 from app.models.player import Player, PlayerPosition
 from app.models.enums import TeamType, GamePhase
 from app.models.pitch import Position
+from app.models.events import dump_events
 from app.models.actions import (
     BudgetStatus,
     PurchaseResult,
@@ -109,6 +110,7 @@ class GameManager:
                 team.player_ids.append(player_id)
                 player_count += 1
 
+        game_state.bump_version()
         logger.info(
             "Configured team %s (%s) with %d players for game %s",
             team_id,
@@ -151,6 +153,7 @@ class GameManager:
 
             game_state.pitch.player_positions[player_id] = position
 
+        game_state.bump_version()
         logger.info(
             "Placed %d players for %s in game %s",
             len(positions),
@@ -323,10 +326,7 @@ class GameManager:
 
     def _get_position_key(self, position: PlayerPosition, roster) -> str:
         """Find the position key for a player's position"""
-        for key, pos in roster.positions.items():
-            if pos.role == position.role:
-                return key
-        return "unknown"
+        return roster.position_keys_by_role.get(position.role, "unknown")
 
     def _get_position_limit(self, position_key: str, team_type: TeamType) -> int:
         """Get the quantity limit for a position from roster definition"""
@@ -396,6 +396,7 @@ class GameManager:
 
         game_state.players[player_id] = player
         team.player_ids.append(player_id)
+        game_state.bump_version()
 
         logger.info(
             "Team %s purchased %s for %d gold (game %s)",
@@ -431,6 +432,7 @@ class GameManager:
 
         # Purchase the reroll (validates budget and limit)
         team.purchase_reroll(roster.reroll_cost)
+        game_state.bump_version()
 
         logger.info(
             "Team %s purchased team reroll for %d gold (game %s)",
@@ -467,6 +469,7 @@ class GameManager:
 
         # Conclude the game
         game_state.phase = GamePhase.CONCLUDED
+        game_state.bump_version()
 
         logger.warning(
             "Game %s: %s forfeited (turn timeout). Concluding.",
@@ -724,7 +727,7 @@ class GameManager:
                     (
                         game_state.game_id,
                         str(game_state.phase.value if hasattr(game_state.phase, "value") else game_state.phase),
-                        game_state.model_dump_json(),
+                        game_state.cached_json(),
                         datetime.now(timezone.utc).isoformat(),
                     ),
                 )
@@ -822,7 +825,7 @@ class GameManager:
 
             events_data = {
                 "game_id": game_state.game_id,
-                "events": [event.model_dump(mode="json") for event in game_state.events],
+                "events": dump_events(game_state.events),
             }
             return json.dumps(events_data, indent=2)
 
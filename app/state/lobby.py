@@ -145,6 +145,7 @@ class LobbyManager:
         game_state = self.game_manager.get_game(game_id)
         game_state.team1.name = team1_name
         game_state.team2.name = team2_name
+        game_state.bump_version()
 
         # Record game_agents and update lobby
         with _get_conn() as conn:
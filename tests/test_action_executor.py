@@ -288,6 +288,27 @@ def test_execute_blitz_only_once_per_turn():
     assert "already used" in result.message.lower()
 
 
+def test_turn_limited_handlers_guard_themselves():
+    """Each once-per-turn handler refuses on its own, not only via dispatch"""
+    executor = ActionExecutor(DiceRoller(seed=42))
+    game_state = create_test_game_state()
+    game_state.players["p1"] = create_test_player("p1", "team1")
+    game_state.turn.charge_used = True
+    game_state.turn.quick_pass_used = True
+
+    charge = ActionRequest(action_type=ActionType.CHARGE, player_id="p1", target_player_id="p2")
+    result = executor._execute_charge(game_state, charge)
+    assert result.success is False
+    assert result.message == "Charge already used this turn"
+
+    hand_off = ActionRequest(
+        action_type=ActionType.QUICK_PASS, player_id="p1", target_receiver_id="p2"
+    )
+    result = executor._execute_quick_pass(game_state, hand_off)
+    assert result.success is False
+    assert result.message == "Quick pass already used this turn"
+
+
 def test_execute_pass():
     """Test pass action"""
     executor = ActionExecutor(DiceRoller(seed=42))
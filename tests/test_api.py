@@ -483,6 +483,95 @@ def test_valid_actions_endpoint():
     assert "movable_players" in data
     assert "can_blitz" in data
     assert "can_pass" in data
+    assert data["can_blitz"] == data["can_charge"]
+    assert data["can_pass"] == data["can_hurl"]
+    assert data["can_hand_off"] == data["can_quick_pass"]
+    assert data["can_foul"] == data["can_boot"]
+
+
+def _start_one_on_one_game() -> str:
+    """Create and start a game with a single player per side"""
+    game_id = client.post("/game").json()["game_id"]
+    client.post(
+        f"/game/{game_id}/setup-team",
+        params={"team_id": "team1", "team_type": "city_watch"},
+        json={"constable": "1"}
+    )
+    client.post(
+        f"/game/{game_id}/setup-team",
+        params={"team_id": "team2", "team_type": "unseen_university"},
+        json={"apprentice_wizard": "1"}
+    )
+    client.post(f"/game/{game_id}/join", params={"team_id": "team1"})
+    client.post(f"/game/{game_id}/join", params={"team_id": "team2"})
+    client.post(
+        f"/game/{game_id}/place-players",
+        json={"team_id": "team1", "positions": {"team1_player_0": {"x": 5, "y": 3}}}
+    )
+    client.post(
+        f"/game/{game_id}/place-players",
+        json={"team_id": "team2", "positions": {"team2_player_0": {"x": 20, "y": 3}}}
+    )
+    client.post(f"/game/{game_id}/start")
+    return game_id
+
+
+def test_valid_actions_refreshes_after_action():
+    """Cached valid actions must be rebuilt once the state changes"""
+    game_id = _start_one_on_one_game()
+
+    first = client.get(f"/game/{game_id}/valid-actions").json()
+    assert first == client.get(f"/game/{game_id}/valid-actions").json()
+    assert "team1_player_0" in first["movable_players"]
+
+    response = client.post(
+        f"/game/{game_id}/action",
+        json={
+            "action_type": "move",
+            "player_id": "team1_player_0",
+            "path": [{"x": 6, "y": 3}]
+        }
+    )
+    assert response.status_code == 200
+
+    second = client.get(f"/game/{game_id}/valid-actions").json()
+    assert "team1_player_0" not in second["movable_players"]
+
+
+def test_valid_actions_block_targets_follow_placement_order():
+    """Block targets are listed in the order players were placed on the pitch"""
+    game_id = client.post("/game").json()["game_id"]
+    client.post(
+        f"/game/{game_id}/setup-team",
+        params={"team_id": "team1", "team_type": "city_watch"},
+        json={"constable": "1"}
+    )
+    client.post(
+        f"/game/{game_id}/setup-team",
+        params={"team_id": "team2", "team_type": "unseen_university"},
+        json={"apprentice_wizard": "2"}
+    )
+    client.post(f"/game/{game_id}/join", params={"team_id": "team1"})
+    client.post(f"/game/{game_id}/join", params={"team_id": "team2"})
+    client.post(
+        f"/game/{game_id}/place-players",
+        json={"team_id": "team1", "positions": {"team1_player_0": {"x": 12, "y": 7}}}
+    )
+    # Placed first but scanned last among the attacker's neighbours
+    client.post(
+        f"/game/{game_id}/place-players",
+        json={
+            "team_id": "team2",
+            "positions": {
+                "team2_player_0": {"x": 13, "y": 7},
+                "team2_player_1": {"x": 13, "y": 6},
+            },
+        }
+    )
+    client.post(f"/game/{game_id}/start")
+
+    valid = client.get(f"/game/{game_id}/valid-actions").json()
+    assert valid["blockable_targets"]["team1_player_0"] == ["team2_player_0", "team2_player_1"]
 
 
 def test_valid_actions_invalid_game():
@@ -525,3 +614,88 @@ def test_rematch_endpoint_starts_or_resets_game():
         assert new_state["game_started"] is True
     else:
         assert new_state["phase"] == "setup"
+
+
+def test_suggest_paths_batch():
+    """Batch path suggestions return one result per request, in order"""
+    game_id = _start_one_on_one_game()
+    player_id, pos = "team1_player_0", {"x": 5, "y": 3}
+
+    targets = [{"x": pos["x"], "y": pos["y"] + 1}, {"x": pos["x"], "y": pos["y"] - 1}]
+    response = client.post(
+        f"/game/{game_id}/suggest-paths",
+        json=[{"player_id": player_id, "target_position": t} for t in targets]
+    )
+    assert response.status_code == 200
+    suggestions = response.json()
+    assert [s["target_position"] for s in suggestions] == targets
+    assert all(s["player_id"] == player_id for s in suggestions)
+
+    single = client.get(
+        f"/game/{game_id}/suggest-path",
+        params={"player_id": player_id, "target_x": targets[0]["x"], "target_y": targets[0]["y"]}
+    ).json()
+    assert suggestions[0] == single
+
+
+def test_suggest_paths_rejects_oversized_batch():
+    """Batches above the per-call cap are refused before any search runs"""
+    game_id = _start_one_on_one_game()
+    request = {"player_id": "team1_player_0", "target_position": {"x": 5, "y": 4}}
+
+    response = client.post(f"/game/{game_id}/suggest-paths", json=[request] * 33)
+    assert response.status_code == 400
+
+
+def test_game_delta_returns_changed_fields():
+    """Delta polling sends the full state once, then only what changed"""
+    game_id = client.post("/game").json()["game_id"]
+
+    first = client.get(f"/game/{game_id}/delta").json()
+    assert first["full"] is True
+    assert first["changed"] == client.get(f"/game/{game_id}").json()
+
+    idle = client.get(f"/game/{game_id}/delta", params={"since_version": first["version"]}).json()
+    assert idle == {
+        "version": first["version"], "full": False, "changed": {}, "players": {}, "appended": {}
+    }
+
+    client.post(
+        f"/game/{game_id}/message",
+        params={"sender_id": "team1", "sender_name": "Team 1", "content": "Ready"}
+    )
+    delta = client.get(f"/game/{game_id}/delta", params={"since_version": first["version"]}).json()
+    assert delta["version"] != first["version"]
+    assert delta["full"] is False
+    assert delta["changed"] == {}
+    assert [m["content"] for m in delta["appended"]["messages"]] == ["Ready"]
+
+
+def test_game_delta_after_action_is_small():
+    """After one move the delta carries the mover and the new log entries only"""
+    game_id = _start_one_on_one_game()
+    # Some chat history that a whole-field diff would resend
+    for n in range(20):
+        client.post(
+            f"/game/{game_id}/message",
+            params={"sender_id": "team1", "sender_name": "Team 1", "content": f"Plan {n}"}
+        )
+    baseline = client.get(f"/game/{game_id}/delta").json()
+    events_before = len(baseline["changed"]["events"])
+
+    response = client.post(
+        f"/game/{game_id}/action",
+        json={"action_type": "move", "player_id": "team1_player_0", "path": [{"x": 6, "y": 3}]}
+    )
+    assert response.status_code == 200
+
+    full = client.get(f"/game/{game_id}")
+    delta = client.get(f"/game/{game_id}/delta", params={"since_version": baseline["version"]})
+    body = delta.json()
+
+    assert body["full"] is False
+    assert list(body["players"]) == ["team1_player_0"]
+    assert not {"events", "event_log", "messages", "players"} & body["changed"].keys()
+    assert body["appended"]["events"]
+    assert full.json()["events"][events_before:] == body["appended"]["events"]
+    assert len(delta.content) * 4 < len(full.content)
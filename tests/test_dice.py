@@ -1,6 +1,8 @@
 """Tests for dice rolling system"""
+import dataclasses
 import pytest
 from app.game.dice import DiceRoller
+from app.models.actions import ActionResult, DiceRoll
 
 
 def test_dice_roller_seeded():
@@ -96,3 +98,17 @@ def test_scatter():
         assert -1 <= dy <= 1
         # Should not be (0, 0)
         assert not (dx == 0 and dy == 0)
+
+
+def test_dice_roll_round_trips_through_models():
+    """DiceRoll dataclasses serialise in results and load back from JSON"""
+    roll = DiceRoller(seed=42).roll_target(3, "dodge", {"tackle_zones": -1})
+    result = ActionResult(success=roll.success, message="Dodged", dice_rolls=[roll])
+
+    reloaded = ActionResult.model_validate_json(result.model_dump_json())
+    assert reloaded.dice_rolls == [roll]
+    assert isinstance(reloaded.dice_rolls[0], DiceRoll)
+    assert result.model_dump()["dice_rolls"][0]["modifiers"] == {"tackle_zones": -1}
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        roll.result = 6
@@ -1,7 +1,8 @@
 """Tests for join status and messaging features"""
 import pytest
 from fastapi.testclient import TestClient
-from app.main import app
+from app.main import app, game_manager
+from app.models.game_state import TurnState
 
 
 client = TestClient(app)
@@ -298,3 +299,44 @@ def test_invalid_team_join():
         params={"team_id": "invalid_team"}
     )
     assert response.status_code == 400
+
+
+def test_messages_with_turn_filter_and_limit():
+    """Limit applies to the newest messages within the requested turn"""
+    response = client.post("/game")
+    game_id = response.json()["game_id"]
+    game_state = game_manager.get_game(game_id)
+    game_state.turn = TurnState(team_turn=1, active_team_id="team1")
+
+    for i in range(4):
+        client.post(
+            f"/game/{game_id}/message",
+            params={"sender_id": "team1", "sender_name": "Team 1", "content": f"Turn 1 #{i}"}
+        )
+    game_state.turn.team_turn = 2
+    client.post(
+        f"/game/{game_id}/message",
+        params={"sender_id": "team1", "sender_name": "Team 1", "content": "Turn 2"}
+    )
+
+    response = client.get(f"/game/{game_id}/messages", params={"turn_number": 1, "limit": 2})
+    data = response.json()
+    assert [m["content"] for m in data["messages"]] == ["Turn 1 #2", "Turn 1 #3"]
+
+
+def test_messages_limit_zero_or_negative_matches_slicing():
+    """A limit of 0 returns everything; a negative limit drops the oldest"""
+    response = client.post("/game")
+    game_id = response.json()["game_id"]
+
+    for i in range(4):
+        client.post(
+            f"/game/{game_id}/message",
+            params={"sender_id": "team1", "sender_name": "Team 1", "content": f"Message {i}"}
+        )
+
+    everything = client.get(f"/game/{game_id}/messages", params={"limit": 0}).json()
+    assert [m["content"] for m in everything["messages"]] == [f"Message {i}" for i in range(4)]
+
+    trimmed = client.get(f"/game/{game_id}/messages", params={"limit": -1}).json()
+    assert [m["content"] for m in trimmed["messages"]] == ["Message 1", "Message 2", "Message 3"]
@@ -4,6 +4,7 @@ from app.models.pitch import Position, Pitch
 from app.models.player import Player, PlayerPosition
 from app.models.team import Team, TEAM_ROSTERS
 from app.models.enums import PlayerState, TeamType, SkillType
+from app.models.game_state import GameState, TurnState, EVENT_LOG_MAXLEN
 
 
 def test_position_equality():
@@ -65,21 +66,36 @@ def test_pitch_move_player():
     assert pitch.is_occupied(new_pos)
 
 
+def test_pitch_occupancy_grid():
+    """Occupancy grid maps coordinates to the player standing there"""
+    pitch = Pitch()
+    pitch.player_positions["player1"] = Position(x=5, y=7)
+    pitch.player_positions["player2"] = Position(x=6, y=8)
+
+    grid = pitch.occupancy_grid()
+
+    assert grid == {(5, 7): "player1", (6, 8): "player2"}
+
+
 def test_pitch_ball_handling():
     """Test ball pickup and drop"""
     pitch = Pitch()
     pitch.player_positions["player1"] = Position(x=5, y=7)
     pitch.place_ball(Position(x=5, y=7))
     
+    assert pitch.ball_on_ground
+    
     # Pick up ball
     pitch.pick_up_ball("player1")
     assert pitch.ball_carrier == "player1"
     assert pitch.ball_position == Position(x=5, y=7)
+    assert not pitch.ball_on_ground
     
     # Drop ball
     pitch.drop_ball()
     assert pitch.ball_carrier is None
     assert pitch.ball_position == Position(x=5, y=7)
+    assert pitch.ball_on_ground
 
 
 def test_player_movement_tracking():
@@ -108,6 +124,49 @@ def test_player_movement_tracking():
     assert player.movement_remaining == 6
 
 
+def test_player_characteristic_targets():
+    """Characteristic strings parse to target numbers without leaking into dumps"""
+    position = PlayerPosition(
+        role="Test",
+        cost=50000,
+        max_quantity=16,
+        ma=6,
+        st=3,
+        ag="3+",
+        pa="4+",
+        av="10+"
+    )
+    player = Player(id="p1", team_id="t1", position=position)
+
+    assert player.get_agility_target() == 3
+    assert player.get_passing_target() == 4
+    assert player.get_armor_value() == 10
+    assert "ag_target" not in position.model_dump()
+
+    # Targets follow edits to the characteristic strings
+    assert position.model_copy(update={"ag": "5+"}).ag_target == 5
+    position.av = "8+"
+    assert player.get_armor_value() == 8
+
+
+def test_player_rejects_invalid_number():
+    """Jersey numbers are checked on direct construction, not only on validation"""
+    position = PlayerPosition(
+        role="Test",
+        cost=50000,
+        max_quantity=16,
+        ma=6,
+        st=3,
+        ag="3+",
+        pa="4+",
+        av="9+"
+    )
+
+    with pytest.raises(ValueError):
+        Player(id="p1", team_id="t1", position=position, number=0)
+    assert Player(id="p1", team_id="t1", position=position, number=1).number == 1
+
+
 def test_player_state_transitions():
     """Test player state changes"""
     position = PlayerPosition(
@@ -166,3 +225,121 @@ def test_team_rosters_defined():
     wizards = TEAM_ROSTERS[TeamType.UNSEEN_UNIVERSITY]
     assert "apprentice_wizard" in wizards.positions
     assert "senior_wizard" in wizards.positions
+
+
+def test_roster_position_keys_by_role():
+    """Every roster role maps back to its position key"""
+    for roster in TEAM_ROSTERS.values():
+        for key, position in roster.positions.items():
+            assert roster.position_keys_by_role[position.role] == key
+
+
+def test_game_state_event_log_is_bounded():
+    """Legacy event log keeps only the most recent entries"""
+    state = GameState(
+        game_id="bounded",
+        team1=Team(id="team1", name="Team 1", team_type=TeamType.CITY_WATCH),
+        team2=Team(id="team2", name="Team 2", team_type=TeamType.UNSEEN_UNIVERSITY),
+    )
+    for i in range(EVENT_LOG_MAXLEN + 5):
+        state.add_event(f"event {i}")
+
+    assert len(state.event_log) == EVENT_LOG_MAXLEN
+    assert state.event_log[0] == "event 5"
+    assert state.recent_events(2) == [
+        f"event {EVENT_LOG_MAXLEN + 3}",
+        f"event {EVENT_LOG_MAXLEN + 4}",
+    ]
+
+
+def test_game_state_recent_events_limit_matches_slicing():
+    """A limit of 0 or below keeps the old [-limit:] slice behaviour"""
+    state = GameState(
+        game_id="history",
+        team1=Team(id="team1", name="Team 1", team_type=TeamType.CITY_WATCH),
+        team2=Team(id="team2", name="Team 2", team_type=TeamType.UNSEEN_UNIVERSITY),
+    )
+    for i in range(4):
+        state.add_event(f"event {i}")
+    entries = list(state.event_log)
+
+    for limit in (-5, -1, 0, 1, 3, 10):
+        assert state.recent_events(limit) == entries[-limit:]
+
+
+def test_game_state_cached_json_tracks_mutations():
+    """Cached JSON dump is reused until the state changes"""
+    state = GameState(
+        game_id="cached",
+        team1=Team(id="team1", name="Team 1", team_type=TeamType.CITY_WATCH),
+        team2=Team(id="team2", name="Team 2", team_type=TeamType.UNSEEN_UNIVERSITY),
+    )
+    first = state.cached_json()
+    assert state.cached_json() is first
+
+    state.add_message("team1", "Team 1", "Forward!")
+
+    refreshed = state.cached_json()
+    assert refreshed is not first
+    assert "Forward!" in refreshed
+
+
+def test_game_state_messages_for_turn():
+    """messages_for_turn returns each turn's messages in order, including after a reload"""
+    state = GameState(
+        game_id="chatty",
+        team1=Team(id="team1", name="Team 1", team_type=TeamType.CITY_WATCH),
+        team2=Team(id="team2", name="Team 2", team_type=TeamType.UNSEEN_UNIVERSITY),
+    )
+    state.add_message("team1", "Team 1", "Before kickoff")
+    state.turn = TurnState(team_turn=1, active_team_id="team1")
+    state.add_message("team1", "Team 1", "Go left")
+    state.add_message("team2", "Team 2", "Hold the line")
+
+    assert [m.content for m in state.messages_for_turn(None)] == ["Before kickoff"]
+    assert [m.content for m in state.messages_for_turn(1)] == ["Go left", "Hold the line"]
+    assert state.messages_for_turn(2) == []
+
+    reloaded = GameState.model_validate_json(state.model_dump_json())
+    assert [m.content for m in reloaded.messages_for_turn(1)] == ["Go left", "Hold the line"]
+
+
+def test_game_state_messages_are_bounded(monkeypatch):
+    """Chat history keeps the newest messages and per-turn lookup follows it"""
+    import app.models.game_state as game_state_module
+    monkeypatch.setattr(game_state_module, "MESSAGE_LOG_MAXLEN", 3)
+
+    state = GameState(
+        game_id="chatty",
+        team1=Team(id="team1", name="Team 1", team_type=TeamType.CITY_WATCH),
+        team2=Team(id="team2", name="Team 2", team_type=TeamType.UNSEEN_UNIVERSITY),
+    )
+    state.add_message("team1", "Team 1", "Before kickoff")
+    state.turn = TurnState(team_turn=1, active_team_id="team1")
+    assert state.messages_for_turn(None)[0].content == "Before kickoff"
+    for text in ("One", "Two", "Three"):
+        state.add_message("team1", "Team 1", text)
+
+    assert [m.content for m in state.messages] == ["One", "Two", "Three"]
+    assert state.messages_for_turn(None) == []
+    assert [m.content for m in state.messages_for_turn(1)] == ["One", "Two", "Three"]
+
+
+def test_game_state_team_players_follow_team_id():
+    """Team players include everyone with that team_id, even if off the roster list"""
+    team1 = Team(id="team1", name="Team 1", team_type=TeamType.CITY_WATCH)
+    team2 = Team(id="team2", name="Team 2", team_type=TeamType.UNSEEN_UNIVERSITY)
+    state = GameState(game_id="roster", team1=team1, team2=team2)
+    position = TEAM_ROSTERS[TeamType.CITY_WATCH].positions["constable"]
+    for player_id, team in (("b", team1), ("x", team2), ("a", team1)):
+        state.players[player_id] = Player(id=player_id, team_id=team.id, position=position)
+        team.player_ids.append(player_id)
+    # Added straight to players, as tests often do
+    state.players["c"] = Player(id="c", team_id="team1", position=position, has_acted=True)
+
+    assert [p.id for p in state.get_team_players("team1")] == ["b", "a", "c"]
+    assert [p.id for p in state.get_team_players("team2")] == ["x"]
+
+    state.turn = TurnState(team_turn=1, active_team_id="team1")
+    state.switch_turn()
+    assert state.players["c"].has_acted is False
@@ -80,6 +80,27 @@ def test_tackle_zones_ignore_prone():
     assert tz_count == 0
 
 
+def test_tackle_zone_map_matches_per_square_count():
+    """Whole-board tackle zone map agrees with get_tackle_zones"""
+    handler = MovementHandler(DiceRoller(seed=42))
+    game_state = create_test_game_state()
+
+    for pid, (x, y) in {"enemy1": (6, 7), "enemy2": (7, 8)}.items():
+        game_state.players[pid] = create_test_player(pid, "team2")
+        game_state.pitch.player_positions[pid] = Position(x=x, y=y)
+    prone = create_test_player("enemy3", "team2")
+    prone.knock_down()
+    game_state.players["enemy3"] = prone
+    game_state.pitch.player_positions["enemy3"] = Position(x=5, y=6)
+
+    zones = handler.get_tackle_zone_map(game_state, "team1")
+
+    for x in range(3, 10):
+        for y in range(4, 11):
+            expected = handler.get_tackle_zones(game_state, "team1", Position(x=x, y=y))
+            assert zones.get((x, y), 0) == expected
+
+
 def test_requires_dodge():
     """Test dodge requirement detection"""
     handler = MovementHandler(DiceRoller(seed=42))
@@ -203,6 +224,26 @@ def test_move_player_with_dodge():
     assert dice_rolls[0].type == "dodge"
 
 
+def test_move_player_dodge_counts_zones_at_destination():
+    """Dodging into another tackle zone carries its penalty"""
+    handler = MovementHandler(DiceRoller(seed=42))
+    game_state = create_test_game_state()
+    
+    game_state.players["p1"] = create_test_player("p1", "team1")
+    game_state.pitch.player_positions["p1"] = Position(x=5, y=7)
+    
+    for enemy_id, pos in (("enemy1", Position(x=4, y=7)), ("enemy2", Position(x=7, y=7))):
+        game_state.players[enemy_id] = create_test_player(enemy_id, "team2")
+        game_state.pitch.player_positions[enemy_id] = pos
+    
+    # Leaving enemy1's zone into enemy2's zone
+    path = [Position(x=6, y=7)]
+    _, dice_rolls, _ = handler.move_player(game_state, "p1", path, allow_rush=False)
+    
+    assert dice_rolls[0].type == "dodge"
+    assert dice_rolls[0].modifiers == {"tackle_zones": -1}
+
+
 def test_stand_up_costs_movement():
     """Test that standing up costs 3 MA"""
     handler = MovementHandler(DiceRoller(seed=42))
@@ -1,6 +1,6 @@
 """Tests for pathfinding and risk assessment"""
 import pytest
-from app.game.pathfinding import PathFinder, SquareRisk, PathSuggestion
+from app.game.pathfinding import PathFinder, SquareRisk, PathSuggestion, PathRequest
 from app.game.movement import MovementHandler
 from app.game.dice import DiceRoller
 from app.models.game_state import GameState
@@ -197,6 +197,25 @@ def test_suggest_path_occupied_square(pathfinder, basic_game_state):
     assert "occupied" in suggestion.error_message
 
 
+def test_suggest_paths_matches_single_suggestions(pathfinder, basic_game_state):
+    """Batch suggestions should equal one suggest_path call per request"""
+    player_id = basic_game_state.team1.player_ids[0]
+    blocker_id = basic_game_state.team2.player_ids[0]
+    basic_game_state.pitch.player_positions[blocker_id] = Position(x=7, y=8)
+
+    requests = [
+        PathRequest(player_id=player_id, target_position=Position(x=8, y=7)),
+        PathRequest(player_id=player_id, target_position=Position(x=5, y=9)),
+        PathRequest(player_id=blocker_id, target_position=Position(x=9, y=8)),
+    ]
+    suggestions = pathfinder.suggest_paths(basic_game_state, requests)
+
+    assert suggestions == [
+        pathfinder.suggest_path(basic_game_state, r.player_id, r.target_position)
+        for r in requests
+    ]
+
+
 def test_assess_square_risk_no_tackle_zones(pathfinder, basic_game_state):
     """Test risk assessment with no tackle zones"""
     player_id = basic_game_state.team1.player_ids[0]
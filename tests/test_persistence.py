@@ -123,6 +123,8 @@ def test_restore_active_games_round_trip(db_path):
         assert len(game.players) == len(original.players)
         assert game.team1.name == original.team1.name
         assert game.team2.name == original.team2.name
+        assert list(game.event_log) == list(original.event_log)
+        assert game.event_log.maxlen == original.event_log.maxlen
 
 
 def test_restore_resets_turn_clock(db_path):
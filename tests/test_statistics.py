@@ -6,7 +6,7 @@ from app.models.game_state import GameState
 from app.models.team import Team
 from app.models.player import Player, PlayerPosition
 from app.models.enums import TeamType, PlayerState, GamePhase
-from app.models.events import GameEvent, EventType, EventResult, DiceRoll
+from app.models.events import GameEvent, EventType, EventResult, DiceRoll, dump_events
 from app.models.pitch import Position
 
 
@@ -285,3 +285,37 @@ def test_get_dice_summary(basic_game_state):
     assert summary["agility"]["success"] == 2
     assert summary["agility"]["failure"] == 1
     assert summary["agility"]["success_rate"] == pytest.approx(66.67, rel=0.1)
+
+
+def test_dump_events_matches_per_event_dump():
+    """Bulk event dumping gives the same dicts as dumping each event."""
+    events = [
+        GameEvent(
+            event_id="e1",
+            timestamp=datetime.now(),
+            game_id="test_game",
+            half=1,
+            turn_number=1,
+            active_team_id="team1",
+            event_type=EventType.DODGE,
+            result=EventResult.SUCCESS,
+            player_id="player1",
+            to_position=Position(x=6, y=5),
+            dice_rolls=[DiceRoll(type="dodge", result=4, target=3, success=True)],
+            description="Player dodged",
+        ),
+        GameEvent(
+            event_id="e2",
+            timestamp=datetime.now(),
+            game_id="test_game",
+            half=1,
+            turn_number=1,
+            active_team_id="team1",
+            event_type=EventType.MOVE,
+            result=EventResult.SUCCESS,
+            player_id="player1",
+            description="Player moved",
+        ),
+    ]
+
+    assert dump_events(events) == [event.model_dump(mode="json") for event in events]